@@ -1,14 +1,27 @@
 import requests
+import sys
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 import datetime
 from cartopy.feature.nightshade import Nightshade
 import numpy as np
+import asyncio
+import aiohttp
+import threading
+import queue
 
 # Global variables
-positions = []
+# Trail ring buffers: two preallocated arrays with a head index, so each
+# frame writes one slot and set_data gets arrays in their native format
+TRAIL_LEN = 200
+trail_lons = np.full(TRAIL_LEN, np.nan)
+trail_lats = np.full(TRAIL_LEN, np.nan)
+trail_head = 0
+trail_count = 0
 view_from_iss = None
 view_on_earth = None
 iss_dot = None
@@ -16,9 +29,10 @@ trail = None
 timestamp_text = None
 iss_info_text = None
 nightshade = None
+last_nightshade_minute = None
 ax = None
 
-# Get ISS position
+# Get ISS position (used once at startup, before the window opens)
 def get_iss_position():
     try:
         response = requests.get("http://api.open-notify.org/iss-now.json")
@@ -32,20 +46,68 @@ def get_iss_position():
         print("Error:", e)
         return None
 
+# Positions fetched in the background end up in this queue so the
+# animation never blocks on the network
+position_queue = queue.Queue()
+
+async def fetch_positions():
+    """Fetch the ISS position every 5 seconds in the background"""
+    # One session so the TCP connection is reused between requests
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get("http://api.open-notify.org/iss-now.json") as response:
+                    response.raise_for_status()
+                    data = await response.json()
+                lat = float(data['iss_position']['latitude'])
+                lon = float(data['iss_position']['longitude'])
+                timestamp = data['timestamp']
+                position_queue.put((lat, lon, timestamp))
+            except Exception as e:
+                print("Error:", e)
+            await asyncio.sleep(5)
+
+def start_fetcher():
+    """Run the asyncio fetcher in a daemon thread"""
+    thread = threading.Thread(target=lambda: asyncio.run(fetch_positions()),
+                              daemon=True)
+    thread.start()
+
 # Update function for animation
 def update(frame):
-    global positions, iss_dot, trail, timestamp_text, iss_info_text, view_from_iss, view_on_earth, nightshade
+    global trail_head, trail_count, iss_dot, trail, timestamp_text, iss_info_text, view_from_iss, view_on_earth, nightshade, last_nightshade_minute
 
-    result = get_iss_position()
+    # Drain the newest position without blocking; if nothing has arrived
+    # yet, keep showing the previous position
+    result = None
+    try:
+        while True:
+            result = position_queue.get_nowait()
+    except queue.Empty:
+        pass
     if result:
         lat, lon, timestamp = result
         dt = datetime.datetime.utcfromtimestamp(timestamp)
 
-        # Update ISS trail
-        positions.append((lon, lat))
-        if len(positions) > 200:
-            positions.pop(0)
-        lons, lats = zip(*positions)
+        # Update ISS trail: write the newest sample into the ring buffers
+        trail_lons[trail_head] = lon
+        trail_lats[trail_head] = lat
+        trail_head = (trail_head + 1) % TRAIL_LEN
+        trail_count = min(trail_count + 1, TRAIL_LEN)
+
+        # Unroll the ring into chronological order for set_data
+        if trail_count < TRAIL_LEN:
+            lons = trail_lons[:trail_count]
+            lats = trail_lats[:trail_count]
+        else:
+            lons = np.concatenate((trail_lons[trail_head:], trail_lons[:trail_head]))
+            lats = np.concatenate((trail_lats[trail_head:], trail_lats[:trail_head]))
+        # Break the trail where it wraps across the dateline, otherwise
+        # PlateCarree draws a line across the whole map
+        break_idx = np.where(np.abs(np.diff(lons)) > 180)[0] + 1
+        if break_idx.size:
+            lons = np.insert(lons, break_idx, np.nan)
+            lats = np.insert(lats, break_idx, np.nan)
         trail.set_data(lons, lats)
         iss_dot.set_data([lon], [lat])
 
@@ -64,16 +126,41 @@ def update(frame):
             f'Lat: {lat:.2f}° | Lon: {lon:.2f}° | Alt: ~263 mi | Speed: {int(speed_mph)} mph'
         )
 
-        # Update nightshade
-        if nightshade:
-            nightshade.remove()
-        nightshade = Nightshade(dt, alpha=0.3)
-        ax.add_feature(nightshade)
+        # Update nightshade, but only when the UTC minute changes -
+        # rebuilding the terminator polygon every frame is expensive
+        minute = dt.replace(second=0)
+        if minute != last_nightshade_minute:
+            last_nightshade_minute = minute
+            if nightshade:
+                nightshade.remove()
+            # Keep the artist returned by add_feature - it is what can be
+            # removed again on the next rollover
+            nightshade = ax.add_feature(Nightshade(dt, alpha=0.3, delta=2.0))
+            # The nightshade is not in the blit path, so force one full
+            # redraw to get it into the cached background
+            ani._blit_cache.clear()
+            fig.canvas.draw()
+
+    # Give FuncAnimation the artists to blit
+    return iss_dot, trail, view_from_iss, view_on_earth, timestamp_text, iss_info_text
+
+# Optional: pass "--save out.mp4" to render the animation to a file
+save_path = None
+if len(sys.argv) > 2 and sys.argv[1] == '--save':
+    save_path = sys.argv[2]
 
 # Set up figure and map
-fig = plt.figure(figsize=(12, 6))
 proj = ccrs.PlateCarree()
-ax = plt.axes(projection=proj)
+if save_path:
+    # For saving, build the figure without pyplot: a plain Figure with an
+    # Agg canvas skips pyplot's GUI event plumbing, which makes
+    # FuncAnimation.save noticeably faster
+    fig = matplotlib.figure.Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(projection=proj)
+else:
+    fig = plt.figure(figsize=(12, 6))
+    ax = plt.axes(projection=proj)
 ax.set_global()
 ax.coastlines()
 ax.add_feature(cfeature.BORDERS, linestyle=':')
@@ -81,32 +168,50 @@ ax.add_feature(cfeature.LAND, facecolor='lightyellow')
 ax.add_feature(cfeature.OCEAN, facecolor='lightblue')
 
 # Plot elements
-iss_dot, = ax.plot([], [], 'ro', label='ISS', transform=ccrs.Geodetic())
-trail, = ax.plot([], [], color='blue', linewidth=1, transform=ccrs.Geodetic())
-view_from_iss, = ax.plot([], [], 'go', label='Earth View from ISS', transform=ccrs.Geodetic())
-view_on_earth, = ax.plot([], [], 'mo', label='View of ISS from Earth', transform=ccrs.Geodetic())
-
-# Texts
-timestamp_text = ax.text(0.5, -0.08, '', transform=ax.transAxes, ha='center', fontsize=10)
-iss_info_text = ax.text(0.5, -0.12, '', transform=ax.transAxes, ha='center', fontsize=10)
+# PlateCarree instead of Geodetic: the points are already finely sampled,
+# so cartopy's per-segment geodesic interpolation is wasted work
+iss_dot, = ax.plot([], [], 'ro', label='ISS', transform=ccrs.PlateCarree())
+trail, = ax.plot([], [], color='blue', linewidth=1, transform=ccrs.PlateCarree())
+view_from_iss, = ax.plot([], [], 'go', label='Earth View from ISS', transform=ccrs.PlateCarree())
+view_on_earth, = ax.plot([], [], 'mo', label='View of ISS from Earth', transform=ccrs.PlateCarree())
+
+# Texts, placed just inside the bottom of the map: FuncAnimation only
+# blits the axes area, so text below the axes would never refresh
+timestamp_text = ax.text(0.5, 0.06, '', transform=ax.transAxes, ha='center', fontsize=10,
+                         bbox=dict(facecolor='white', alpha=0.6, edgecolor='none'))
+iss_info_text = ax.text(0.5, 0.02, '', transform=ax.transAxes, ha='center', fontsize=10,
+                        bbox=dict(facecolor='white', alpha=0.6, edgecolor='none'))
 
 # Initial ISS position
 initial = get_iss_position()
 if initial:
     lat, lon, timestamp = initial
-    positions.append((lon, lat))
+    trail_lons[trail_head] = lon
+    trail_lats[trail_head] = lat
+    trail_head = (trail_head + 1) % TRAIL_LEN
+    trail_count += 1
     iss_dot.set_data([lon], [lat])
     dt = datetime.datetime.utcfromtimestamp(timestamp)
     timestamp_text.set_text(f'Time: {dt.strftime("%Y-%m-%d %H:%M:%S")} UTC')
-    nightshade = Nightshade(dt, alpha=0.3)
-    ax.add_feature(nightshade)
+    nightshade = ax.add_feature(Nightshade(dt, alpha=0.3, delta=2.0))
+    last_nightshade_minute = dt.replace(second=0)
 
 # Legend
 ax.legend(loc='lower left')
 
-# Animate
-ani = FuncAnimation(fig, update, interval=5000, blit=False)
-
-plt.tight_layout()
-plt.show()
+# Start fetching positions in the background
+start_fetcher()
+
+# Animate: blit only the returned artists instead of redrawing the whole
+# cartopy figure every frame, and don't keep frame data we never use
+ani = FuncAnimation(fig, update, interval=5000, blit=True, cache_frame_data=False,
+                    save_count=60 if save_path else None)
+
+if save_path:
+    # 60 frames at the 5 s fetch cadence = 5 minutes of tracking
+    ani.save(save_path, writer='ffmpeg')
+    print(f"Animation saved to {save_path}")
+else:
+    plt.tight_layout()
+    plt.show()
 
@@ -1,5 +1,7 @@
 import ephem
 import datetime
+import math
+from collections import deque
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
@@ -19,9 +21,10 @@ iss = ephem.readtle(name, line1, line2)
 current_time = datetime.datetime(2012, 1, 8, 11, 23, 42)
 time_step = datetime.timedelta(seconds=10)
 
-# Position history
-past_lons = []
-past_lats = []
+# Position history (limited to 100 points for performance; the deque
+# drops the oldest point in O(1) instead of list.pop(0) shifting all)
+past_lons = deque(maxlen=100)
+past_lats = deque(maxlen=100)
 
 # Set up the map
 fig = plt.figure(figsize=(12, 6), num="ISS Tracker - Use Arrow Keys")
@@ -35,19 +38,19 @@ marker, = ax.plot([], [], 'ro', markersize=8, label="ISS", transform=ccrs.Geodet
 trail, = ax.plot([], [], 'b-', linewidth=1.5, alpha=0.6, transform=ccrs.Geodetic())
 title = ax.set_title("", pad=20)
 
+def sublatlon(obj):
+    """Return the sub-satellite latitude and longitude in degrees"""
+    return math.degrees(float(obj.sublat)), math.degrees(float(obj.sublong))
+
 def update_position():
     """Update the ISS position on the map"""
     iss.compute(current_time)
-    lon = float(iss.sublong) * 180.0 / ephem.pi
-    lat = float(iss.sublat) * 180.0 / ephem.pi
+    lat, lon = sublatlon(iss)
     
-    # Store history (limit to 100 points for performance)
+    # Store history
     past_lons.append(lon)
     past_lats.append(lat)
-    if len(past_lons) > 100:
-        past_lons.pop(0)
-        past_lats.pop(0)
-    
+
     # Update visuals
     marker.set_data(lon, lat)
     trail.set_data(past_lons, past_lats)
@@ -7,6 +7,9 @@
 
 import ephem
 import datetime
+import math
+import os
+import time
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
@@ -20,14 +23,27 @@ plt.switch_backend('Qt5Agg')
 # ===== CONFIGURATION =====
 ISS_VIEW_RANGE = 2000  # Visibility range in kilometers (2000 km ≈ ISS horizon)
 TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=tle"
+TLE_CACHE_PATH = os.path.expanduser("~/.cache/iss_tracker/stations.tle")
+TLE_CACHE_TTL = 2 * 60 * 60  # Re-download TLE data after 2 hours (seconds)
 # ===== END CONFIGURATION =====
 
 def fetch_latest_tle():
     """Download the most recent ISS TLE data from Celestrak"""
     try:
-        response = requests.get(TLE_URL)
-        response.raise_for_status()
-        lines = response.text.strip().split('\n')
+        # Reuse a recent on-disk copy instead of hitting the network at
+        # every startup (TLE data only needs refreshing every few hours)
+        if os.path.exists(TLE_CACHE_PATH) and \
+                time.time() - os.path.getmtime(TLE_CACHE_PATH) < TLE_CACHE_TTL:
+            with open(TLE_CACHE_PATH) as cache_file:
+                text = cache_file.read()
+        else:
+            response = requests.get(TLE_URL)
+            response.raise_for_status()
+            text = response.text
+            os.makedirs(os.path.dirname(TLE_CACHE_PATH), exist_ok=True)
+            with open(TLE_CACHE_PATH, 'w') as cache_file:
+                cache_file.write(text)
+        lines = text.strip().split('\n')
         return lines[0].strip(), lines[1].strip(), lines[2].strip()  # Name, Line1, Line2
     except Exception as e:
         print(f"ERROR: Failed to fetch TLE data. Using fallback TLE.\nReason: {e}")
@@ -63,40 +79,55 @@ iss_marker, = ax.plot([], [], 'ro', markersize=8, label="ISS", transform=ccrs.Ge
 visibility_circle, = ax.plot([], [], 'y--', linewidth=1, label=f"{ISS_VIEW_RANGE} km Visibility", transform=ccrs.Geodetic())
 title = ax.set_title("", pad=20)
 
-def calculate_visibility_circle(lat, lon, radius_km):
-    """Generate points for a circle around (lat, lon) with given radius (great-circle distance)"""
-    angles = np.linspace(0, 2 * np.pi, 100)
-    earth_radius_km = 6371.0
-    circle_lons, circle_lats = [], []
-    
-    for angle in angles:
-        # Calculate new latitude/longitude using haversine formula
-        delta = radius_km / earth_radius_km
-        circle_lat = np.arcsin(
-            np.sin(np.radians(lat)) * np.cos(delta) + 
-            np.cos(np.radians(lat)) * np.sin(delta) * np.cos(angle)
-        )
-        circle_lon = np.radians(lon) + np.arctan2(
-            np.sin(angle) * np.sin(delta) * np.cos(np.radians(lat)),
-            np.cos(delta) - np.sin(np.radians(lat)) * np.sin(circle_lat)
-        )
-        circle_lats.append(np.degrees(circle_lat))
-        circle_lons.append(np.degrees(circle_lon))
-    
+# Precomputed circle tables: the 100 sample angles and the visibility
+# radius never change between key presses, so their trig is done once here
+circle_angles = np.linspace(0, 2 * np.pi, 100)
+sin_angles = np.sin(circle_angles)
+cos_angles = np.cos(circle_angles)
+circle_delta = ISS_VIEW_RANGE / 6371.0  # Angular radius (Earth radius 6371 km)
+sin_delta = np.sin(circle_delta)
+cos_delta = np.cos(circle_delta)
+
+def calculate_visibility_circle(lat, lon):
+    """Generate points for the visibility circle around (lat, lon) (great-circle distance)"""
+    # Calculate new latitudes/longitudes using the haversine formula;
+    # only the terms that depend on lat/lon are computed per call
+    lat_r = np.radians(lat)
+    lon_r = np.radians(lon)
+    sin_lat = np.sin(lat_r)
+    cos_lat = np.cos(lat_r)
+    circle_lats = np.arcsin(sin_lat * cos_delta + cos_lat * sin_delta * cos_angles)
+    circle_lons = lon_r + np.arctan2(
+        sin_angles * sin_delta * cos_lat,
+        cos_delta - sin_lat * np.sin(circle_lats)
+    )
+    circle_lons = np.degrees(circle_lons)
+    circle_lats = np.degrees(circle_lats)
+
+    # Break the circle where it wraps across the dateline so the jump in
+    # longitude is not drawn as a spurious line across the map
+    break_idx = np.where(np.abs(np.diff(circle_lons)) > 180)[0] + 1
+    if break_idx.size:
+        circle_lons = np.insert(circle_lons, break_idx, np.nan)
+        circle_lats = np.insert(circle_lats, break_idx, np.nan)
+
     return circle_lons, circle_lats
 
+def sublatlon(obj):
+    """Return the sub-satellite latitude and longitude in degrees"""
+    return math.degrees(float(obj.sublat)), math.degrees(float(obj.sublong))
+
 def update_position():
     """Update ISS position and visibility circle"""
     try:
         iss.compute(current_time)
-        lon = float(iss.sublong) * 180.0 / ephem.pi
-        lat = float(iss.sublat) * 180.0 / ephem.pi
-        
+        lat, lon = sublatlon(iss)
+
         # Update ISS marker
         iss_marker.set_data([lon], [lat])
         
         # Update visibility circle
-        circle_lons, circle_lats = calculate_visibility_circle(lat, lon, ISS_VIEW_RANGE)
+        circle_lons, circle_lats = calculate_visibility_circle(lat, lon)
         visibility_circle.set_data(circle_lons, circle_lats)
         
         # Update title
@@ -105,18 +136,37 @@ def update_position():
     except Exception as e:
         print(f"Error updating position: {e}")
 
+# Debounce flag: holding an arrow key fires on_key dozens of times per
+# second, but we render at most one update per timer interval
+pending_update = False
+
+def do_update():
+    """Run the update scheduled by on_key"""
+    global pending_update
+    pending_update = False
+    update_position()
+
 def on_key(event):
     """Handle keyboard time navigation"""
-    global current_time
+    global current_time, pending_update
     if event.key == "right":
         current_time += time_step
     elif event.key == "left":
         current_time -= time_step
-    update_position()
+    # Only bump the time here; the heavy update runs from the timer so
+    # rapid key-repeats are coalesced into one recompute
+    if not pending_update:
+        pending_update = True
+        update_timer.start()
 
 # Connect keyboard events
 fig.canvas.mpl_connect('key_press_event', on_key)
 
+# Single-shot timer that defers updates by 50 ms to coalesce key-repeats
+update_timer = fig.canvas.new_timer(interval=50)
+update_timer.single_shot = True
+update_timer.add_callback(do_update)
+
 # Initial update
 update_position()
 plt.legend(loc='upper right')
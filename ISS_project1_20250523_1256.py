@@ -8,10 +8,16 @@
 
 import ephem
 import datetime
+import collections
+import concurrent.futures
+import math
+import os
+import time
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.feature.nightshade import Nightshade
+from sgp4.api import Satrec, jday
 import requests
 import numpy as np
 
@@ -36,6 +42,12 @@ ISS_VIEW_RANGE = 2000
 
 # Where to get ISS position data
 TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=tle"
+TLE_CACHE_PATH = os.path.expanduser("~/.cache/iss_tracker/stations.tle")
+TLE_CACHE_TTL = 2 * 60 * 60  # Re-download TLE data after 2 hours (seconds)
+
+# Rendered basemap pixels from a previous run (keyed by figure size, so a
+# changed figsize gets its own cache file)
+BASEMAP_CACHE_PATH = os.path.expanduser("~/.cache/iss_tracker/basemap_12x6.npy")
 
 # Orbit path settings:
 # - Shows 30 minutes before and after current time
@@ -48,9 +60,20 @@ isspath_step = datetime.timedelta(seconds=60)
 def fetch_latest_tle():
     """Get the most recent ISS position data from the internet"""
     try:
-        response = requests.get(TLE_URL)
-        response.raise_for_status()
-        lines = response.text.strip().split('\n')
+        # Reuse a recent on-disk copy instead of hitting the network at
+        # every startup (TLE data only needs refreshing every few hours)
+        if os.path.exists(TLE_CACHE_PATH) and \
+                time.time() - os.path.getmtime(TLE_CACHE_PATH) < TLE_CACHE_TTL:
+            with open(TLE_CACHE_PATH) as cache_file:
+                text = cache_file.read()
+        else:
+            response = requests.get(TLE_URL)
+            response.raise_for_status()
+            text = response.text
+            os.makedirs(os.path.dirname(TLE_CACHE_PATH), exist_ok=True)
+            with open(TLE_CACHE_PATH, 'w') as cache_file:
+                cache_file.write(text)
+        lines = text.strip().split('\n')
         return lines[0].strip(), lines[1].strip(), lines[2].strip()
     except Exception as e:
         print(f"Warning: Couldn't get fresh ISS data. Using backup data.\nError: {e}")
@@ -60,138 +83,283 @@ def fetch_latest_tle():
             "2 25544  51.6374  84.8753 0002567 126.2244  18.1297 15.49625942510847"
         )
 
-def calculate_visibility_circle(lat, lon, radius_km):
+# Precomputed circle tables: the 100 sample angles and the visibility
+# radius never change between key presses, so their trig is done once here
+circle_angles = np.linspace(0, 2 * np.pi, 100)
+sin_angles = np.sin(circle_angles)
+cos_angles = np.cos(circle_angles)
+circle_delta = ISS_VIEW_RANGE / 6371.0  # Angular radius (Earth radius 6371 km)
+sin_delta = np.sin(circle_delta)
+cos_delta = np.cos(circle_delta)
+
+def calculate_visibility_circle(lat, lon):
     """Draw a circle around the ISS showing its visibility range"""
-    angles = np.linspace(0, 2 * np.pi, 100)
-    earth_radius_km = 6371.0
-    circle_lons, circle_lats = [], []
-    
-    for angle in angles:
-        # Math to calculate points on a circle on Earth's surface
-        delta = radius_km / earth_radius_km
-        circle_lat = np.arcsin(
-            np.sin(np.radians(lat)) * np.cos(delta) + 
-            np.cos(np.radians(lat)) * np.sin(delta) * np.cos(angle)
-        )
-        circle_lon = np.radians(lon) + np.arctan2(
-            np.sin(angle) * np.sin(delta) * np.cos(np.radians(lat)),
-            np.cos(delta) - np.sin(np.radians(lat)) * np.sin(circle_lat)
-        )
-        circle_lats.append(np.degrees(circle_lat))
-        circle_lons.append(np.degrees(circle_lon))
-    
+    # Math to calculate points on a circle on Earth's surface;
+    # only the terms that depend on lat/lon are computed per call
+    lat_r = np.radians(lat)
+    lon_r = np.radians(lon)
+    sin_lat = np.sin(lat_r)
+    cos_lat = np.cos(lat_r)
+    circle_lats = np.arcsin(sin_lat * cos_delta + cos_lat * sin_delta * cos_angles)
+    circle_lons = lon_r + np.arctan2(
+        sin_angles * sin_delta * cos_lat,
+        cos_delta - sin_lat * np.sin(circle_lats)
+    )
+    circle_lons = np.degrees(circle_lons)
+    circle_lats = np.degrees(circle_lats)
+
+    # Break the circle where it wraps across the dateline so the jump in
+    # longitude is not drawn as a spurious line across the map
+    break_idx = np.where(np.abs(np.diff(circle_lons)) > 180)[0] + 1
+    if break_idx.size:
+        circle_lons = np.insert(circle_lons, break_idx, np.nan)
+        circle_lats = np.insert(circle_lats, break_idx, np.nan)
+
     return circle_lons, circle_lats
 
-def calculate_orbit_path(iss_obj, center_time, dt_before, dt_after, step):
+# Cache of already-computed orbit samples, keyed by whole-second offset
+# from a reference epoch fixed at startup. An arrow key only shifts the
+# path window slightly, so most samples can be reused between presses.
+orbit_cache = collections.OrderedDict()
+orbit_cache_epoch = None
+
+def sublatlon(obj):
+    """Return the sub-satellite latitude and longitude in degrees"""
+    return math.degrees(float(obj.sublat)), math.degrees(float(obj.sublong))
+
+def teme_to_latlon(positions, jds, frs):
+    """Convert sgp4 position vectors (TEME frame, km) to lat/lon in degrees"""
+    x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
+
+    # Greenwich mean sidereal time (IAU 1982 model), vectorized
+    t = (jds - 2451545.0 + frs) / 36525.0
+    gmst_s = (67310.54841 + (876600.0 * 3600 + 8640184.812866) * t
+              + 0.093104 * t**2 - 6.2e-6 * t**3)
+    gmst = np.radians((gmst_s % 86400.0) / 240.0)  # 240 seconds per degree
+
+    lons = np.degrees(np.arctan2(y, x) - gmst)
+    lons = ((lons + 180.0) % 360.0) - 180.0
+    # Geocentric latitude; differs from geodetic by <0.2 degrees, which is
+    # invisible at this map scale
+    lats = np.degrees(np.arctan2(z, np.sqrt(x**2 + y**2)))
+    return lons, lats
+
+def calculate_orbit_path(center_time, dt_before, dt_after, step):
     """Calculate where the ISS will be before and after current time"""
-    times = []
-    start_time = center_time - dt_before
-    end_time = center_time + dt_after
-    
-    current = start_time
-    while current <= end_time:
-        times.append(current)
-        current += step
-    
-    lons, lats = [], []
-    for t in times:
-        iss_obj.compute(t)
-        lons.append(float(iss_obj.sublong) * 180.0 / ephem.pi)
-        lats.append(float(iss_obj.sublat) * 180.0 / ephem.pi)
-    
+    global orbit_cache_epoch
+    if orbit_cache_epoch is None:
+        orbit_cache_epoch = center_time.replace(second=0, microsecond=0)
+
+    # Second offsets (from the reference epoch) of the samples we need
+    step_s = int(step.total_seconds())
+    start_s = int(round((center_time - dt_before - orbit_cache_epoch).total_seconds()))
+    n = int((dt_before + dt_after) / step) + 1
+    offsets = range(start_s, start_s + n * step_s, step_s)
+
+    # Propagate all the samples that slid into the window since last time
+    # in one vectorized sgp4 call instead of one pyephem call per sample
+    missing = [offset for offset in offsets if offset not in orbit_cache]
+    if missing:
+        jds = np.empty(len(missing))
+        frs = np.empty(len(missing))
+        for i, offset in enumerate(missing):
+            t = orbit_cache_epoch + datetime.timedelta(seconds=offset)
+            jds[i], frs[i] = jday(t.year, t.month, t.day,
+                                  t.hour, t.minute, t.second + t.microsecond * 1e-6)
+        errors, positions, velocities = iss_sat.sgp4_array(jds, frs)
+        lons, lats = teme_to_latlon(positions, jds, frs)
+        for offset, lon, lat in zip(missing, lons, lats):
+            orbit_cache[offset] = (lon, lat)
+
+    # Evict samples that drifted far outside the current window
+    lo = start_s - int(dt_before.total_seconds())
+    hi = start_s + (n - 1) * step_s + int(dt_after.total_seconds())
+    for offset in [key for key in orbit_cache if key < lo or key > hi]:
+        del orbit_cache[offset]
+
+    # Assemble the path from the cached samples inside the window,
+    # breaking it where it wraps across the dateline so PlateCarree does
+    # not draw a line across the whole map
+    lons = np.array([orbit_cache[offset][0] for offset in offsets])
+    lats = np.array([orbit_cache[offset][1] for offset in offsets])
+    break_idx = np.where(np.abs(np.diff(lons)) > 180)[0] + 1
+    if break_idx.size:
+        lons = np.insert(lons, break_idx, np.nan)
+        lats = np.insert(lats, break_idx, np.nan)
     return lons, lats
 
-def haversine_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance between two points on Earth's surface (in km)"""
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-    return 6371 * 2 * np.arcsin(np.sqrt(a))
-
-def straight_line_distance(lat1, lon1, alt1, lat2, lon2, alt2=0):
-    """Calculate straight-line distance through space (in km)"""
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
+def distances(lat, lon, alt_km, tlat, tlon):
+    """Calculate the ground (great-circle) and straight-line distances
+    between the ISS and the target in one pass (both in km)"""
+    lat_r, lon_r, tlat_r, tlon_r = np.radians([lat, lon, tlat, tlon])
     R = 6371.0
-    x1 = (R + alt1) * np.cos(lat1) * np.cos(lon1)
-    y1 = (R + alt1) * np.cos(lat1) * np.sin(lon1)
-    z1 = (R + alt1) * np.sin(lat1)
-    x2 = (R + alt2) * np.cos(lat2) * np.cos(lon2)
-    y2 = (R + alt2) * np.cos(lat2) * np.sin(lon2)
-    z2 = (R + alt2) * np.sin(lat2)
-    return np.sqrt((x2-x1)**2 + (y2-y1)**2 + (z2-z1)**2)
+
+    # Trig terms shared by both distance formulas, computed once
+    sin_lat, cos_lat = np.sin(lat_r), np.cos(lat_r)
+    sin_tlat, cos_tlat = np.sin(tlat_r), np.cos(tlat_r)
+
+    # Ground distance via the haversine formula
+    a = (np.sin((tlat_r - lat_r) / 2)**2 +
+         cos_lat * cos_tlat * np.sin((tlon_r - lon_r) / 2)**2)
+    ground_dist = R * 2 * np.arcsin(np.sqrt(a))
+
+    # Straight-line distance through space from the same sines/cosines
+    x1 = (R + alt_km) * cos_lat * np.cos(lon_r)
+    y1 = (R + alt_km) * cos_lat * np.sin(lon_r)
+    z1 = (R + alt_km) * sin_lat
+    x2 = R * cos_tlat * np.cos(tlon_r)
+    y2 = R * cos_tlat * np.sin(tlon_r)
+    z2 = R * sin_tlat
+    direct_dist = np.sqrt((x2-x1)**2 + (y2-y1)**2 + (z2-z1)**2)
+
+    return ground_dist, direct_dist
+
+# Cached pixels of the static map (stock image, coastlines, nightshade)
+# used for blitting. Invalidated whenever the nightshade is rebuilt.
+background = None
+
+# UTC minute of the last nightshade rebuild - the terminator barely moves
+# within a minute, so there is no point rebuilding it every key press
+last_nightshade_minute = None
+
+# Worker that propagates the orbit path off the GUI thread; one worker
+# keeps the cache access serialized
+orbit_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+# Update channels: the ISS marker and visibility circle refresh on every
+# key press, the orbit path only every 10th press (or when the time
+# leaves the window it was computed for), the nightshade once a minute
+tick = 0
+path_window_start = None
+path_window_end = None
+
+def apply_orbit_path(future):
+    """Put a freshly computed orbit path on the map once the worker is done"""
+    try:
+        path_lons, path_lats = future.result()
+    except Exception as e:
+        print(f"Error computing orbit path: {e}")
+        return
+    orbit_path.set_data(path_lons, path_lats)
+    fig.canvas.draw_idle()
+
+def on_draw(event):
+    """After any full redraw, recapture the static background and put the
+    moving artists back on top of it"""
+    global background
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    for artist in (orbit_path, visibility_circle, iss_marker, title):
+        ax.draw_artist(artist)
 
 def update_position():
     """Update everything on the map"""
+    global background, last_nightshade_minute, path_window_start, path_window_end
     try:
         # Calculate ISS position
         iss.compute(current_time)
-        lon = float(iss.sublong) * 180.0 / ephem.pi
-        lat = float(iss.sublat) * 180.0 / ephem.pi
+        lat, lon = sublatlon(iss)
         alt_km = iss.elevation / 1000.0
         
         # Update ISS marker position
         iss_marker.set_data([lon], [lat])
         
-        # Update orbit path
-        path_lons, path_lats = calculate_orbit_path(iss, current_time, 
-                                                 isspath_dt_before, isspath_dt_after, 
-                                                 isspath_step)
-        orbit_path.set_data(path_lons, path_lats)
-        
-        # Update day/night shading (now showing DAY in yellow)
-        for patch in night_patches:
-            patch.remove()
-        night_patches.clear()
-        # We invert the alpha to shade day instead of night
-        night_patches.append(ax.add_feature(Nightshade(current_time, alpha=0.7, color='yellow')))
+        # Update orbit path: propagate in the worker so the GUI stays
+        # responsive; the previous path stays on screen until it is ready.
+        # The path spans +/-30 minutes, so it only needs refreshing every
+        # 10th key press or once the time leaves the window on screen
+        if (path_window_start is None or tick % 10 == 0
+                or not (path_window_start <= current_time <= path_window_end)):
+            path_window_start = current_time - isspath_dt_before
+            path_window_end = current_time + isspath_dt_after
+            future = orbit_executor.submit(calculate_orbit_path, current_time,
+                                           isspath_dt_before, isspath_dt_after,
+                                           isspath_step)
+            future.add_done_callback(apply_orbit_path)
         
+        # Update day/night shading (now showing DAY in yellow), but only
+        # when the UTC minute changes - rebuilding the Nightshade polygon
+        # every key press is expensive
+        minute = current_time.replace(second=0, microsecond=0)
+        if minute != last_nightshade_minute:
+            last_nightshade_minute = minute
+            for patch in night_patches:
+                patch.remove()
+            night_patches.clear()
+            # We invert the alpha to shade day instead of night
+            night_patches.append(ax.add_feature(Nightshade(current_time, alpha=0.7,
+                                                           color='yellow', delta=2.0)))
+            # The static map changed, so the cached background is stale
+            background = None
+
         # Update visibility circle
-        circle_lons, circle_lats = calculate_visibility_circle(lat, lon, ISS_VIEW_RANGE)
+        circle_lons, circle_lats = calculate_visibility_circle(lat, lon)
         visibility_circle.set_data(circle_lons, circle_lats)
 
         # Calculate distances
-        ground_dist = haversine_distance(lat, lon, target_lat, target_lon)
-        direct_dist = straight_line_distance(lat, lon, alt_km, target_lat, target_lon)
+        ground_dist, direct_dist = distances(lat, lon, alt_km, target_lat, target_lon)
         
         # Update title with information
         title_text = f"Time (UTC): {current_time}\n"
         title_text += f"ISS Position: Lat {lat:.2f}° | Lon {lon:.2f}° | Alt {alt_km:.0f} km\n"
         title_text += f"Ground Distance: {ground_dist:.0f} km | Direct Distance: {direct_dist:.0f} km"
         title.set_text(title_text)
-        
-        # Refresh the display
-        fig.canvas.draw_idle()
+
+        # Refresh the display: blit only the moving artists over the
+        # cached background instead of re-rendering the whole map
+        if background is None:
+            fig.canvas.draw_idle()  # Full render; on_draw recaptures the background
+        else:
+            fig.canvas.restore_region(background)
+            for artist in (orbit_path, visibility_circle, iss_marker, title):
+                ax.draw_artist(artist)
+            fig.canvas.blit(fig.bbox)
     except Exception as e:
         print(f"Error updating position: {e}")
 
+# Debounce flag: holding an arrow key fires on_key dozens of times per
+# second, but we render at most one update per timer interval
+pending_update = False
+
+def do_update():
+    """Run the update scheduled by on_key"""
+    global pending_update
+    pending_update = False
+    update_position()
+
 def on_key(event):
     """Handle keyboard time navigation (fixed Shift detection)"""
-    global current_time
-    
+    global current_time, pending_update, tick
+    tick += 1
+
     # Debug: Uncomment to check key presses in terminal
-    # print(f"Key pressed: {event.key}")  
-    
+    # print(f"Key pressed: {event.key}")
+
     if event.key.lower() in ("right", "shift+right"):
         if "shift" in event.key.lower():
             current_time += long_time_step  # 10-minute jump
             print("10-minute jump forward")  # Optional confirmation
         else:
             current_time += time_step  # 30-second jump
-            
+
     elif event.key.lower() in ("left", "shift+left"):
         if "shift" in event.key.lower():
             current_time -= long_time_step  # 10-minute jump
             print("10-minute jump backward")  # Optional confirmation
         else:
             current_time -= time_step  # 30-second jump
-    
-    update_position()
+
+    # Only bump the time here; the heavy update runs from the timer so
+    # rapid key-repeats are coalesced into one recompute
+    if not pending_update:
+        pending_update = True
+        update_timer.start()
 
 # ===== SETUP =====
 # Get ISS position data
 name, line1, line2 = fetch_latest_tle()
 iss = ephem.readtle(name, line1, line2)
+# Vectorized propagator used for batch orbit path sampling
+iss_sat = Satrec.twoline2rv(line1, line2)
 
 # Clean up time (remove seconds/microseconds)
 current_time = current_time.replace(second=0, microsecond=0)
@@ -199,30 +367,64 @@ current_time = current_time.replace(second=0, microsecond=0)
 # Create the map
 fig = plt.figure(figsize=(12, 6), num="ISS Tracker - Use Arrow Keys")
 ax = plt.axes(projection=ccrs.PlateCarree())
-ax.stock_img()  # Add basic map features
-ax.coastlines()
-ax.add_feature(cfeature.BORDERS)
+ax.set_global()
+if os.path.exists(BASEMAP_CACHE_PATH):
+    # Reuse the basemap pixels rendered by a previous run instead of
+    # rasterizing stock_img/coastlines/borders again (~1 s of startup)
+    basemap = np.load(BASEMAP_CACHE_PATH)
+    ax.imshow(basemap, extent=(-180, 180, -90, 90), origin='upper',
+              transform=ccrs.PlateCarree(), zorder=0)
+else:
+    ax.stock_img()  # Add basic map features
+    ax.coastlines()
+    ax.add_feature(cfeature.BORDERS)
+    # Render once now, before the nightshade and plot elements exist, and
+    # save the static base layer so later runs can skip the cartopy work
+    fig.canvas.draw()
+    buf = np.asarray(fig.canvas.buffer_rgba())
+    bbox = ax.get_window_extent()
+    height = buf.shape[0]
+    crop = buf[height - int(bbox.y1):height - int(bbox.y0),
+               int(bbox.x0):int(bbox.x1)]
+    os.makedirs(os.path.dirname(BASEMAP_CACHE_PATH), exist_ok=True)
+    np.save(BASEMAP_CACHE_PATH, crop.copy())
 
 # Create map elements:
 # - Red dot for ISS
 # - Magenta circle for visibility range
 # - Blue star for target location
 # - Green line for orbit path
-iss_marker, = ax.plot([], [], 'ro', markersize=8, label="ISS", transform=ccrs.Geodetic())
-visibility_circle, = ax.plot([], [], '--', color='magenta', linewidth=1, 
-                           label=f"{ISS_VIEW_RANGE} km Visibility", transform=ccrs.Geodetic())
-target_marker, = ax.plot([target_lon], [target_lat], 'b*', markersize=10, 
-                        label="Target Location", transform=ccrs.Geodetic())
-orbit_path, = ax.plot([], [], 'g-', linewidth=1, alpha=0.5, 
-                     label="Orbit Path", transform=ccrs.Geodetic())
+# The moving elements are marked animated so full redraws leave them out
+# of the static background captured for blitting.
+# PlateCarree instead of Geodetic: the points are already finely sampled,
+# so cartopy's per-segment geodesic interpolation is wasted work
+iss_marker, = ax.plot([], [], 'ro', markersize=8, label="ISS",
+                     transform=ccrs.PlateCarree(), animated=True)
+visibility_circle, = ax.plot([], [], '--', color='magenta', linewidth=1,
+                           label=f"{ISS_VIEW_RANGE} km Visibility",
+                           transform=ccrs.PlateCarree(), animated=True)
+target_marker, = ax.plot([target_lon], [target_lat], 'b*', markersize=10,
+                        label="Target Location", transform=ccrs.PlateCarree())
+orbit_path, = ax.plot([], [], 'g-', linewidth=1, alpha=0.5,
+                     label="Orbit Path", transform=ccrs.PlateCarree(), animated=True)
 title = ax.set_title("", pad=20)
+title.set_animated(True)
 
 # Setup for day/night shading
 night_patches = []
-night_patches.append(ax.add_feature(Nightshade(current_time, alpha=0.7, color='yellow')))
+# delta=2.0 gives a much coarser (and cheaper) terminator polygon than
+# the 0.1-degree default; the difference is invisible at this figure size
+night_patches.append(ax.add_feature(Nightshade(current_time, alpha=0.7,
+                                               color='yellow', delta=2.0)))
 
-# Connect keyboard controls
+# Connect keyboard controls and the background capture for blitting
 fig.canvas.mpl_connect('key_press_event', on_key)
+fig.canvas.mpl_connect('draw_event', on_draw)
+
+# Single-shot timer that defers updates by 50 ms to coalesce key-repeats
+update_timer = fig.canvas.new_timer(interval=50)
+update_timer.single_shot = True
+update_timer.add_callback(do_update)
 
 # First update of the display
 update_position()